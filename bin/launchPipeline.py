@@ -27,7 +27,6 @@ from __future__ import with_statement
 import re, sys, os, os.path, shutil, subprocess
 import optparse, traceback
 from lsst.pex.logging import Log
-from lsst.pex.policy import Policy
 import lsst.pex.harness.run as run
 
 usage = """usage: %prog policy_file runid [pipelineName] [-vqsd] [-L lev] [-n file]"""
@@ -60,15 +59,14 @@ def createLog():
     log = Log(Log.getDefaultLog(), "harness.launchPipeline")
     return log
 
-def setVerbosity(verbosity):
+def setVerbosity(logger, verbosity):
     logger.setThreshold(run.verbosity2threshold(verbosity, -1))  
 
-logger = createLog()
-
 def main():
+    logger = createLog()
     try:
         (cl.opts, cl.args) = cl.parse_args();
-        setVerbosity(cl.opts.verbosity)
+        setVerbosity(logger, cl.opts.verbosity)
 
         if len(cl.args) < 1:
             print usage
@@ -81,39 +79,40 @@ def main():
         if len(cl.args) > 2:
             name = cl.args[2]
     
-        logger.log(Log.INFO, "command line option 0 : policyFile :  " + cl.args[0])
-        logger.log(Log.INFO, "command line option 1 : runid :  " + cl.args[1])
-
-        if (cl.opts.logdir == None):
-            logger.log(Log.INFO, "command line logdir option is None ")
-        else:
-            logger.log(Log.INFO, "command line logdir option : " + cl.opts.logdir)
-
-        if (name == None):
-            logger.log(Log.INFO, "name is None")
-        else:
-            logger.log(Log.INFO, name)
-
-        if (cl.opts.verbosity == None):
-            logger.log(Log.INFO, "verbosity option not specified")
-        else:
-            logger.log(Log.INFO, cl.opts.verbosity)
-
-        if (cl.opts.workerid == None):
-            logger.log(Log.INFO, "workerid option not specified")
-        else:
-            logger.log(Log.INFO, cl.opts.workerid)
+        # don't bother formatting the option report if it won't be shown
+        if logger.sends(Log.INFO):
+            logger.log(Log.INFO, "command line option 0 : policyFile :  " + cl.args[0])
+            logger.log(Log.INFO, "command line option 1 : runid :  " + cl.args[1])
+
+            if (cl.opts.logdir == None):
+                logger.log(Log.INFO, "command line logdir option is None ")
+            else:
+                logger.log(Log.INFO, "command line logdir option : " + cl.opts.logdir)
+
+            if (name == None):
+                logger.log(Log.INFO, "name is None")
+            else:
+                logger.log(Log.INFO, name)
+
+            if (cl.opts.verbosity == None):
+                logger.log(Log.INFO, "verbosity option not specified")
+            else:
+                logger.log(Log.INFO, cl.opts.verbosity)
+
+            if (cl.opts.workerid == None):
+                logger.log(Log.INFO, "workerid option not specified")
+            else:
+                logger.log(Log.INFO, cl.opts.workerid)
     
         run.launchPipeline(cl.args[0], cl.args[1], cl.opts.workerid, name, cl.opts.verbosity, cl.opts.logdir)
 
     except SystemExit:
         pass
     except:
-        tb = traceback.format_exception(sys.exc_info()[0],
-                                        sys.exc_info()[1],
-                                        sys.exc_info()[2])
+        tb = traceback.format_exception(*sys.exc_info())
         logger.log(Log.FATAL, tb[-1].strip())
-        logger.log(Log.DEBUG, "".join(tb[0:-1]).strip())
+        if logger.sends(Log.DEBUG):
+            logger.log(Log.DEBUG, "".join(tb[0:-1]).strip())
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -32,19 +32,9 @@ If the pipeline policy references other policy files (via the "@" file
 include format), it is assumed that the given path is relative to the 
 current working directory where this script is executed. 
 """
-from lsst.pex.harness.Queue import Queue
-from lsst.pex.harness.Clipboard import Clipboard
-from lsst.pex.harness.Pipeline import Pipeline
 import lsst.pex.harness.run as run
-
-import lsst.pex.policy as policy
 from lsst.pex.logging import Log
 
-import lsst.daf.base as dafBase
-from lsst.daf.base import PropertySet
-
-import lsst.ctrl.events as events
-
 import os
 import sys
 import optparse, traceback
@@ -54,28 +44,32 @@ desc = """Execute the pipeline described by the given policy, assigning it
 the given run ID.
 """
 
-cl = optparse.OptionParser(usage=usage, description=desc)
-cl.add_option("-n", "--name", action="store", default=None, dest="name",
-              help="a name for identifying the pipeline")
-cl.add_option("-V", "--verbosity", action="store", default=None, dest="verbosity",
-              help="verbosity level of logging for the pipeline")
-cl.add_option("-g", "--logdir", action="store", default=None, dest="logdir",
-              help="directory into which log files will be written")
-cl.add_option("-w", "--workerid", action="store", default=None, dest="workerid",
-              help="identifier for a pipeline worker within a production")
-
-run.addVerbosityOption(cl)
+def createOptionParser():
+    """create the parser for the command line.  This is deferred until
+    main() so that importing this module does no parser set-up.
+    """
+    cl = optparse.OptionParser(usage=usage, description=desc)
+    cl.add_option("-n", "--name", action="store", default=None, dest="name",
+                  help="a name for identifying the pipeline")
+    cl.add_option("-V", "--verbosity", action="store", default=None, dest="verbosity",
+                  help="verbosity level of logging for the pipeline")
+    cl.add_option("-g", "--logdir", action="store", default=None, dest="logdir",
+                  help="directory into which log files will be written")
+    cl.add_option("-w", "--workerid", action="store", default=None, dest="workerid",
+                  help="identifier for a pipeline worker within a production")
+
+    run.addVerbosityOption(cl)
+    return cl
 
 def createLog():
     log = Log(Log.getDefaultLog(), "harness.runPipeline")
     return log
 
-logger = createLog()
-
 def main():
     """parse the input arguments and execute the pipeline
     """
 
+    cl = createOptionParser()
     (cl.opts, cl.args) = cl.parse_args()
     logthresh = run.verbosity2threshold(cl.opts.verbosity)
 
@@ -88,6 +82,8 @@ def main():
     pipelinePolicyName = cl.args[0]
     runId = cl.args[1]
 
+    logger = createLog()
+
     logger.log(Log.INFO, "pipelinePolicyName " + pipelinePolicyName)
     logger.log(Log.INFO, "runId " + runId)
 
@@ -116,6 +112,10 @@ def runPipeline(policyFile, runId, logthresh=None, name=None, logdir=None, worke
     @param logthresh    the logging threshold to use to control the verbosity
                            of messages.
     """
+    # the Pipeline pulls in the full stack; import it only when we are
+    # actually going to run one.
+    from lsst.pex.harness.Pipeline import Pipeline
+
     if name is None or name == "None":
         name = os.path.splitext(os.path.basename(policyFile))[0]
     
@@ -144,7 +144,7 @@ if (__name__ == '__main__'):
     try:
         main()
     except run.UsageError, e:
-        print >> sys.stderr, "%s: %s" % (cl.get_prog_name(), e)
+        print >> sys.stderr, "%s: %s" % (os.path.basename(sys.argv[0]), e)
         sys.exit(1)
     except Exception, e:
         log = Log(Log.getDefaultLog(),"runPipeline")
@@ -27,7 +27,7 @@ import threading
 import lsst.daf.base as dafBase
 from lsst.daf.base import *
 
-import lsst.ctrl.events as events
+from lsst.pex.harness.TriggerClient import TriggerClient
 import time
 
 if __name__ == "__main__":
@@ -36,13 +36,15 @@ if __name__ == "__main__":
 
     eventBrokerHost = "lsst8.ncsa.uiuc.edu" 
 
-    externalEventTransmitter = events.EventTransmitter(eventBrokerHost, "triggerAssociationEvent")
+    client = TriggerClient(eventBrokerHost)
 
     root = PropertySet()
 
-    root.setInt("visitId", 1)
-    root.setDouble("FOVRa", 273.48066298343)
-    root.setDouble("FOVDec", -27.125)
+    for name, value in (("visitId", 1),
+                        ("FOVRa", 273.48066298343),
+                        ("FOVDec", -27.125)):
+        root.set(name, value)
 
-    externalEventTransmitter.publish(root)
+    client.publish("triggerAssociationEvent", root)
+    client.close()
 
@@ -27,7 +27,7 @@ import threading
 import lsst.daf.base as dafBase
 from lsst.daf.base import *
 
-import lsst.ctrl.events as events
+from lsst.pex.harness.TriggerClient import TriggerClient
 import time
 
 if __name__ == "__main__":
@@ -35,13 +35,14 @@ if __name__ == "__main__":
 
     eventBrokerHost = "lsst8.ncsa.uiuc.edu"
 
-    externalEventTransmitter = events.EventTransmitter(eventBrokerHost, "triggerMatchMopEvent")
+    client = TriggerClient(eventBrokerHost)
 
     root = PropertySet()
 
     root.setInt("visitId", 1)
 
-    externalEventTransmitter.publish(root)
+    client.publish("triggerMatchMopEvent", root)
+    client.close()
 
 
 
@@ -27,7 +27,7 @@ import threading
 import lsst.daf.base as dafBase
 from lsst.daf.base import *
 
-import lsst.ctrl.events as events
+from lsst.pex.harness.TriggerClient import TriggerClient
 import time
 
 if __name__ == "__main__":
@@ -36,7 +36,7 @@ if __name__ == "__main__":
     shutdownTopic = "triggerShutdownA"
     eventBrokerHost = "lsst8.ncsa.uiuc.edu"
 
-    externalEventTransmitter = events.EventTransmitter(eventBrokerHost, shutdownTopic )
+    client = TriggerClient(eventBrokerHost)
 
     root = PropertySet()
     # Shutdown at level 1 : stop immediately by killing process (ugly)
@@ -45,5 +45,6 @@ if __name__ == "__main__":
     # Shutdown at level 4 : exit in a clean manner (Pipeline and Slices) at the end of a Visit
     root.setInt("level", 2)
 
-    externalEventTransmitter.publish(root)
+    client.publish(shutdownTopic, root)
+    client.close()
 
@@ -33,6 +33,7 @@ add multiple stages via SimpleStageTester.addStage().
 import lsst.pex.harness as pexHarness
 import lsst.pex.harness.stage as harnessStage
 from lsst.pex.harness.simpleStageTester import SimpleStageTester
+import lsst.pex.harness.policycache as policycache
 import lsst.pex.policy as pexPolicy
 from lsst.pex.logging import Log, Debug, LogRec, Prop
 import lsst.pex.exceptions
@@ -96,7 +97,7 @@ class AreaStageSerial(harnessStage.SerialProcessing):
                                       "AreaStagePolicy_dict.paf", # def. policy
                                            "examples/simpleStageTest" # dir containing policies
                                            )
-        defpol = pexPolicy.Policy.createPolicy(file, file.getRepositoryPath())
+        defpol = policycache.createPolicy(file, file.getRepositoryPath())
         if self.policy is None:
             self.policy = defpol
         else:
@@ -161,7 +162,7 @@ class AreaStageParallel(harnessStage.ParallelProcessing):
                                       "AreaStagePolicy_dict.paf", # def. policy
                                            "examples/simpleStageTest" # dir containing policies
                                            )
-        defpol = pexPolicy.Policy.createPolicy(file, file.getRepositoryPath())
+        defpol = policycache.createPolicy(file, file.getRepositoryPath())
         if self.policy is None:
             self.policy = defpol
         else:
@@ -170,6 +171,10 @@ class AreaStageParallel(harnessStage.ParallelProcessing):
         self.inputScale = self.policy.get("inputScale")
         self.outputScale = self.policy.get("outputScale")
 
+        # the scales are fixed once configured, so compute the factor that
+        # converts input area units to output area units just once here.
+        self.areaScale = 10.0**(2*(self.inputScale - self.outputScale))
+
         self.log = Debug(self.log, "AreaStage")
         if self.outputScale != 0:
             self.log.log(Log.INFO, "Area scaling factor: %i"% self.outputScale)
@@ -181,8 +186,8 @@ class AreaStageParallel(harnessStage.ParallelProcessing):
         if clipboard is not None:
 
             # do our work
-            area = clipboard.get("width") * clipboard.get("height")*\
-                   (10.0**self.inputScale/10.0**self.outputScale)**2
+            area = clipboard.get("width") * clipboard.get("height") * \
+                   self.areaScale
 
             # maybe you want to write a debug message
             self.log.debug(3, "found area of %f" % area)
@@ -190,6 +195,39 @@ class AreaStageParallel(harnessStage.ParallelProcessing):
             # save the results to the clipboard
             clipboard.put("area", area)
 
+    # If a stage may find more than one clipboard waiting on its input
+    # queue, it can override applyProcess() to handle them all together
+    # rather than one per call.
+
+    def applyProcess(self):
+        """
+        process all of the clipboards waiting on the input queue together
+        via processBatch(), and post them to the output queue.
+        """
+        # Don't pop them off yet because failureStage will then not be able
+        # to access them if processBatch() fails
+        clipboards = self.inputQueue.elements()
+
+        self.processBatch(clipboards)
+
+        # Pop them off only now that they have been processed
+        for clipboard in clipboards:
+            self.inputQueue.getNextDataset()
+            self.outputQueue.addDataset(clipboard)
+
+    def processBatch(self, clipboards):
+        """
+        calculate the area for each of the given clipboards.  This gives the
+        same results as calling process() on each one in turn.
+        """
+        clipboards = [c for c in clipboards if c is not None]
+        areas = [c.get("width") * c.get("height") * self.areaScale
+                 for c in clipboards]
+
+        for clipboard, area in zip(clipboards, areas):
+            self.log.debug(3, "found area of %f" % area)
+            clipboard.put("area", area)
+
 # Add this for convenience of testing with SimpleStageTester; otherwise,
 # this is not required.
 #
@@ -51,6 +51,7 @@ class Clipboard(object):
     def close(self):
         # print 'Clearing Clipboard dictionary'
         self.dict.clear()
+        self.isShared.clear()
  
     def getKeys (self):
         """
@@ -24,13 +24,15 @@
 
 
 import lsst.pex.policy as Policy
-import lsst.pex.exceptions as pexExcept
 
 import lsst.daf.base as dafBase
 from lsst.daf.base import *
 
 import os
 
+# the standard named directories returned by Directories.getDirs()
+standardDirs = ("work", "input", "output", "update", "scratch")
+
 ##
 # @brief   a determination of the various directory roots that can be 
 #              used by a pipeline.  
@@ -83,6 +85,8 @@ class Directories(object):
         self.shortname = shortName
         self.patdata = { "runid": self.runid, "shortname": self.shortname }
         self.defroot = None
+        self.defrundir = None
+        self.nameddirs = {}
 
     ## 
     # @brief return the default root directory
@@ -92,9 +96,9 @@ class Directories(object):
 
         root = self.policy.getString("defaultRoot")
         if root == ".":
-            root = os.environ["PWD"]
+            root = os.getcwd()
         elif not os.path.isabs(root):
-            root = os.path.join(os.environ["PWD"], root)
+            root = os.path.join(os.getcwd(), root)
         self.defroot = root
         return root
 
@@ -103,17 +107,17 @@ class Directories(object):
     # This a subdirectory of the default root directory used specifically
     # for the current run of the pipeline (given as an absolute path).
     def getDefaultRunDir(self):
-        root = self.getDefaultRootDir()
+        if self.defrundir is not None:
+            return self.defrundir
 
-        fmt = self.policy.getString("runDirPattern")
-        runDir = fmt % self.patdata
+        runDir = self.policy.getString("runDirPattern") % self.patdata
 
+        # an absolute pattern is still taken to be relative to the root
         if os.path.isabs(runDir):
-            runDir = os.path.splitdrive(runDir)[1]
-            if runDir[0] == os.sep:
-                runDir = runDir[1:]
+            runDir = os.path.splitdrive(runDir)[1].lstrip(os.sep)
 
-        return os.path.join(root, runDir)
+        self.defrundir = os.path.join(self.getDefaultRootDir(), runDir)
+        return self.defrundir
 
     ## 
     # @brief  return the absolute path to "named" directory.
@@ -131,14 +135,18 @@ class Directories(object):
     # names are supported.  If a name is give that was not specified in the
     # policy file, the update directory is returned.  
     def getNamedDirectory(self, name):
-        try:
+        dir = self.nameddirs.get(name)
+        if dir is not None:
+            return dir
+
+        if name != "update" and not self.policy.exists(name):
+            dir = self.getNamedDirectory("update")
+        else:
             dir = self.policy.getString(name) % self.patdata
-        except pexExcept.exceptionsLib.Exception as e:
-            dir = self.policy.getString("update") % self.patdata
+            if not os.path.isabs(dir):
+                dir = os.path.join(self.getDefaultRunDir(), dir)
 
-        if not os.path.isabs(dir):
-            dir = os.path.join(self.getDefaultRunDir(), dir)
-            
+        self.nameddirs[name] = dir
         return dir
 
     ## 
@@ -147,7 +155,7 @@ class Directories(object):
     # "update", and "scratch".  
     def getDirs(self):
         out = lsst.daf.base.PropertySet()
-        for name in "work input output update scratch".split():
-            out.set(name, self.getNamedDirectory(name)) 
+        for name in standardDirs:
+            out.set(name, self.getNamedDirectory(name))
         return out
 
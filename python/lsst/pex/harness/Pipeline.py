@@ -26,8 +26,10 @@
 from lsst.pex.harness.Queue import Queue
 from lsst.pex.harness.stage import StageProcessing
 from lsst.pex.harness.stage import NoOpSerialProcessing
+from lsst.pex.harness.stage import createStageClass
 from lsst.pex.harness.Clipboard import Clipboard
 from lsst.pex.harness.Directories import Directories
+import lsst.pex.harness.policycache as policycache
 from lsst.pex.logging import Log, LogRec, cout, Prop
 from lsst.pex.logging import BlockTimingLog
 from lsst.pex.harness import harnessLib as logutils
@@ -40,8 +42,6 @@ import threading
 from threading import Thread
 from threading import Event as PyEvent
 
-import lsst.pex.policy as policy
-
 import lsst.pex.exceptions
 from lsst.pex.exceptions import *
 
@@ -128,12 +128,17 @@ class Pipeline(object):
         if(self.pipelinePolicyName == None):
             self.pipelinePolicyName = "pipeline_policy.paf"
         dictName = "pipeline_dict.paf"
-        topPolicy = policy.Policy.createPolicy(self.pipelinePolicyName)
+
+        # The pipeline policy, with the stage policy files it includes, is
+        # read by the Pipeline and by every Slice; the cache ensures that
+        # the files are parsed only once per process.
+        topPolicy = policycache.createPolicy(self.pipelinePolicyName,
+                                             loadFiles=True)
 
         if (topPolicy.exists('execute')):
             self.executePolicy = topPolicy.get('execute')
         else:
-            self.executePolicy = policy.Policy.createPolicy(self.pipelinePolicyName)
+            self.executePolicy = topPolicy
 
         # Check for eventBrokerHost 
         if (self.executePolicy.exists('eventBrokerHost')):
@@ -180,14 +185,10 @@ class Pipeline(object):
         # use these to assign some logical names to the stages for logging
         # purposes.  Note, however, that it is only convention that the
         # stage policies will be specified as separate files; thus, we need
-        # a fallback.  
-        stgcfg = self.executePolicy.getArray("appStage")
-        self.stageNames = []
-        for subpol in stgcfg:
-            stageName = subpol.get("name") 
-            self.stageNames.append(stageName)
-
-        self.executePolicy.loadPolicyFiles()
+        # a fallback.  The policy files were loaded when the policy was
+        # read, so this stage list serves the whole configuration.
+        fullStageList = self.executePolicy.getArray("appStage")
+        self.stageNames = [subpol.get("name") for subpol in fullStageList]
 
 
         # Obtain the working directory space locators
@@ -230,7 +231,6 @@ class Pipeline(object):
             self.eventTimeout = 10000000   # default value is 10 000 000
 
         # Process Application Stages
-        fullStageList = self.executePolicy.getArray("appStage")
         self.nStages = len(fullStageList)
         log.log(self.VERB2, "Found %d stages" % len(fullStageList))
 
@@ -254,16 +254,8 @@ class Pipeline(object):
                     "Stage %d: %s: %s" % (stagei+1, self.stageNames[stagei],
                                           fullStageNameList[-1]))
         for astage in fullStageNameList:
-            fullStage = astage.strip()
-            tokenList = astage.split('.')
-            classString = tokenList.pop()
-            classString = classString.strip()
-
-            package = ".".join(tokenList)
-
-            # For example  package -> lsst.pex.harness.App1Stage  classString -> App1Stage
-            AppStage = __import__(package, globals(), locals(), [classString], -1)
-            StageClass = getattr(AppStage, classString)
+            # For example  lsst.pex.harness.App1Stage.App1Stage -> App1Stage
+            StageClass = createStageClass(astage.strip())
             self.stageClassList.append(StageClass) 
 
         #
@@ -271,6 +263,12 @@ class Pipeline(object):
         #   - Read the policy information
         #   - Import failure stage Class and make failure stage instance Object
         #
+        # the system data handed to every stage; each stage adds its own
+        # name and stageId
+        self._sysdata = {"rank": -1,
+                         "universeSize": self.universeSize,
+                         "runId": self._runId}
+
         self.failureStageName = None 
         self.failSerialName   = None
         if (self.executePolicy.exists('failureStage')):
@@ -284,23 +282,9 @@ class Pipeline(object):
                 self.failSerialName = "lsst.pex.harness.stage.NoOpSerialProcessing"
                 failStagePolicy = None
 
-            astage = self.failSerialName
-            tokenList = astage.split('.')
-            failClassString = tokenList.pop()
-            failClassString = failClassString.strip()
-
-            package = ".".join(tokenList)
+            FailStageClass = createStageClass(self.failSerialName.strip())
 
-            # For example  package -> lsst.pex.harness.App1Stage  classString -> App1Stage
-            FailAppStage = __import__(package, globals(), locals(), [failClassString], -1)
-            FailStageClass = getattr(FailAppStage, failClassString)
-
-            sysdata = {}
-            sysdata["name"] = self.failureStageName
-            sysdata["rank"] = -1
-            sysdata["stageId"] = -1
-            sysdata["universeSize"] = self.universeSize
-            sysdata["runId"] =  self._runId
+            sysdata = dict(self._sysdata, name=self.failureStageName, stageId=-1)
             if (failStagePolicy != None):
                 self.failStageObject = FailStageClass(failStagePolicy, self.log, self.eventBrokerHost, sysdata)
             else:
@@ -323,10 +307,10 @@ class Pipeline(object):
             self.shareDataList.append(shareDataStage)
 
         log.log(self.VERB3, "Loading in %d trigger topics" % \
-                len(filter(lambda x: x != "None", self.eventTopicList)))
+                sum(1 for t in self.eventTopicList if t != "None"))
 
         log.log(self.VERB3, "Loading in %d shareData flags" % \
-                len(filter(lambda x: x != "None", self.shareDataList)))
+                len(self.shareDataList))
 
         for iStage in xrange(len(self.eventTopicList)):
             item = self.eventTopicList[iStage]
@@ -336,7 +320,9 @@ class Pipeline(object):
                 log.log(Log.DEBUG, "eventTopic%d: %s" % (iStage+1, item))
 
 
+        # keep the event system for use on every visit
         eventsSystem = events.EventSystem.getDefaultEventSystem()
+        self._eventsSystem = eventsSystem
 
         for topic in self.eventTopicList:
             if (topic == "None"):
@@ -383,17 +369,11 @@ class Pipeline(object):
             # Make an instance of the specifies Application Stage
             # Use a constructor with the Policy as an argument 
             StageClass = self.stageClassList[iStage-1]
-            sysdata = {} 
-            sysdata["name"] = self.stageNames[iStage-1]
-            sysdata["rank"] = -1 
-            sysdata["stageId"] = iStage 
-            sysdata["universeSize"] = self.universeSize 
-            sysdata["runId"] =  self._runId
-            if (stagePolicy != "None"):
-                stageObject = StageClass(stagePolicy, self.log, self.eventBrokerHost, sysdata)  
-                # (self, policy=None, log=None, eventBroker=None, sysdata=None, callSetup=True):
-            else:
-                stageObject = StageClass(None, self.log, self.eventBrokerHost, sysdata)
+            sysdata = dict(self._sysdata, name=self.stageNames[iStage-1],
+                           stageId=iStage)
+            # stagePolicy is None for a stage configured without one, which
+            # the Stage constructor accepts
+            stageObject = StageClass(stagePolicy, self.log, self.eventBrokerHost, sysdata)
             inputQueue  = self.queueList[iStage-1]
             outputQueue = self.queueList[iStage]
 
@@ -503,9 +483,6 @@ class Pipeline(object):
 
                     self.handleEvents(iStage, stagelog)
 
-                    # synchronize before preprocess
-                    self.threadBarrier(iStage)
-
                     self.tryPreProcess(iStage, stage, stagelog)
 
                     # synchronize after preprocess, before process
@@ -516,16 +493,22 @@ class Pipeline(object):
 
                     self.tryPostProcess(iStage, stage, stagelog)
 
-                    # synchronize after postprocess
-                    self.threadBarrier(iStage)
-
                     stagelog.done()
 
                     self.checkExitByStage()
 
+                    # a Slice found no more datasets in this stage
+                    if self.isShutdownRequested():
+                        break
+
                 else:
                     looplog.log(self.VERB2, "Completed Stage Loop")
 
+                if self.isShutdownRequested():
+                    looplog.log(Log.INFO, "terminating pipeline: a Slice found no more datasets")
+                    looplog.done()
+                    break
+
                 self.checkExitByVisit()
 
             # Uncomment to print a list of Citizens after each visit 
@@ -549,6 +532,15 @@ class Pipeline(object):
     def getSliceThreadList(self):
         return self.sliceThreadList
 
+    def isShutdownRequested(self):
+        """
+        Return True if any Slice has asked to leave the stage loop
+        """
+        for slice in self.sliceThreadList:
+            if slice.isShutdownRequested():
+                return True
+        return False
+
     def setExitLevel(self, level):
         self.exitLevel = level
 
@@ -597,27 +589,31 @@ class Pipeline(object):
         log.log(Log.DEBUG, "Entry time %f" % (entryTime)) 
         
 
+        # Signal all of the Slices first so that they proceed concurrently,
+        # rather than releasing each one only after the previous one has
+        # signaled back.
         for i in range(self.nSlices):
-            k = 2*i
-            loopEventA = self.loopEventList[k]
-            loopEventB = self.loopEventList[k+1]
+            loopEventA = self.loopEventList[2*i]
 
             signalTime1 = time.time()
             log.log(Log.DEBUG, "Signal to Slice  %d %f" % (i, signalTime1)) 
 
             loopEventA.set()
 
-            log.log(Log.DEBUG, "Wait for signal from Slice %d" % (i)) 
+        # Excute time sleep in between checks to free the GIL periodically 
+        useDelay = self.barrierDelay
 
-            # Wait for the B event to be set by the Slice
-            # Excute time sleep in between checks to free the GIL periodically 
-            useDelay = self.barrierDelay
+        if(iStage == 1): 
+            useDelay = 0.1
+        if(iStage == 290): 
+            useDelay = 0.1
 
-            if(iStage == 1): 
-                useDelay = 0.1
-            if(iStage == 290): 
-                useDelay = 0.1
+        for i in range(self.nSlices):
+            loopEventB = self.loopEventList[2*i+1]
 
+            log.log(Log.DEBUG, "Wait for signal from Slice %d" % (i)) 
+
+            # Wait for the B event to be set by the Slice
             while( not (loopEventB.isSet())):
                  time.sleep(useDelay)
 
@@ -668,6 +664,13 @@ class Pipeline(object):
 
             oneEventTransmitter.publish(psPtr)
 
+        # stop the Slices, releasing any that wait at a synchronization
+        # point, so that each one leaves its stage loop and ends its thread
+        for i in range(self.nSlices):
+            slice = self.sliceThreadList[i]
+            slice.stop()
+            self.loopEventList[2*i].set()
+
         for i in range(self.nSlices):
             slice = self.sliceThreadList[i]
             slice.join()
@@ -808,7 +811,7 @@ class Pipeline(object):
         wait for a single event of a designated topic
         """
 
-        eventsSystem = events.EventSystem.getDefaultEventSystem()
+        eventsSystem = self._eventsSystem
 
         sleepTimeout = 0.1
         transTimeout = 900
@@ -836,7 +839,7 @@ class Pipeline(object):
         Handles Events: transmit or receive events as specified by Policy
         """
         log = stagelog.timeBlock("handleEvents", self.TRACE-2)
-        eventsSystem = events.EventSystem.getDefaultEventSystem()
+        eventsSystem = self._eventsSystem
 
         thisTopic = self.eventTopicList[iStage-1]
         thisTopic = thisTopic.strip()
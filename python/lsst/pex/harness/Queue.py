@@ -81,6 +81,14 @@ class Queue(object):
 
         return clipboard
 
+    #------------------------------------------------------------------------
+    def elements(self): 
+        """
+        Return a list of all of the Clipboards in the dataset list, from the
+        top down, but do not remove them from the dataset list
+        """
+        return list(self.datasetList)
+
     #------------------------------------------------------------------------
     def addDataset(self, clipboard): 
         """
@@ -25,29 +25,18 @@
 from __future__ import with_statement
 
 from lsst.pex.harness.Queue import Queue
-from lsst.pex.harness.stage import StageProcessing
-from lsst.pex.harness.stage import NoOpParallelProcessing
+from lsst.pex.harness.stage import createStageClass
 from lsst.pex.harness.Clipboard import Clipboard
 from lsst.pex.harness.Directories import Directories
+import lsst.pex.harness.policycache as policycache
 from lsst.pex.logging import Log, LogRec, Prop
 from lsst.pex.logging import BlockTimingLog
 from lsst.pex.harness import harnessLib as logutils
 
-import lsst.pex.policy as policy
-import lsst.pex.exceptions as ex
+from lsst.daf.base import PropertySet
+from lsst.daf.persistence import LogicalLocation
 
-import lsst.daf.base as dafBase
-from lsst.daf.base import *
-import lsst.daf.persistence as dafPersist
-from lsst.daf.persistence import *
-
-
-import lsst.ctrl.events as events
-import lsst.pex.exceptions
-from lsst.pex.exceptions import *
-
-import os, sys, signal, re, traceback, time, datetime
-import threading
+import os, sys, re, traceback, time, datetime
 from threading import Event as PyEvent
 
 
@@ -80,14 +69,20 @@ class Slice(object):
         self._pipelineName = name
         
         self.queueList = []
+        self._clipPool = []
         self.stageList = []
         self.stageClassList = []
         self.stagePolicyList = []
         self.sliceEventTopicList = []
         self.eventTopicList = []
+        self.hasEventTopicList = []
         self.shareDataList = []
         self.shutdownTopic = "triggerShutdownEvent_slice"
         self.executionMode = 0
+        self._shutdown = False
+        self._stopEvent = PyEvent()
+        self.loopEventA = None
+        self.loopEventB = None
         self._runId = runId
         self.pipelinePolicyName = pipelinePolicyName
 
@@ -115,12 +110,17 @@ class Slice(object):
         if(self.pipelinePolicyName == None):
             self.pipelinePolicyName = "pipeline_policy.paf"
         dictName = "pipeline_dict.paf"
-        topPolicy = policy.Policy.createPolicy(self.pipelinePolicyName)
+
+        # The pipeline policy, with the stage policy files it includes, is
+        # read by the Pipeline and by every Slice; the cache ensures that
+        # the files are parsed only once per process.
+        topPolicy = policycache.createPolicy(self.pipelinePolicyName,
+                                             loadFiles=True)
 
         if (topPolicy.exists('execute')):
             self.executePolicy = topPolicy.get('execute')
         else:
-            self.executePolicy = policy.Policy.createPolicy(self.pipelinePolicyName)
+            self.executePolicy = topPolicy
 
         # Check for eventBrokerHost 
         if (self.executePolicy.exists('eventBrokerHost')):
@@ -138,6 +138,13 @@ class Slice(object):
         # The log for use in the Python Slice
         self.log = self.cppLogUtils.getLogger()
 
+        # child logs used on every visit; these are created once here 
+        # rather than once per call.  (The timing logs in tryProcess() 
+        # and handleEvents() are not cached as they must pick up the 
+        # current visit and stage IDs from the stage log's preamble.)
+        self._barrierLog = Log(self.log, "threadBarrier")
+        self._populateLog = Log(self.log, "populateClipboard")
+
         if (self.executePolicy.exists('logThreshold')):
             self.logthresh = self.executePolicy.get('logThreshold')
         else:
@@ -158,17 +165,13 @@ class Slice(object):
         conflog = BlockTimingLog(self.log, "configureSlice", self.TRACE)
         conflog.start()
 
-        stgcfg = self.executePolicy.getArray("appStage")
-
-        self.stageNames = []
-        for subpol in stgcfg:
-            stageName = subpol.get("name")
-            self.stageNames.append(stageName)
-
-        self.executePolicy.loadPolicyFiles()
+        # the policy files were loaded when the policy was read, so the
+        # stage list fetched here is the one used for the whole configuration
+        fullStageList = self.executePolicy.getArray("appStage")
+        self.stageNames = [subpol.get("name") for subpol in fullStageList]
 
         # Obtain the working directory space locators  
-        psLookup = lsst.daf.base.PropertySet()
+        psLookup = PropertySet()
         if (self.executePolicy.exists('dir')):
             dirPolicy = self.executePolicy.get('dir')
             shortName = None
@@ -190,7 +193,7 @@ class Slice(object):
         
         # Configure persistence logical location map with values for directory 
         # work space locators
-        dafPersist.LogicalLocation.setLocationMap(psLookup)
+        LogicalLocation.setLocationMap(psLookup)
 
         # Check for eventTimeout
         if (self.executePolicy.exists('eventTimeout')):
@@ -199,7 +202,6 @@ class Slice(object):
             self.eventTimeout = 10000000   # default value
 
         # Process Application Stages
-        fullStageList = self.executePolicy.getArray("appStage")
         self.nStages = len(fullStageList)
         log.log(self.VERB2, "Found %d stages" % len(fullStageList))
 
@@ -225,16 +227,8 @@ class Slice(object):
                                           fullStageNameList[-1]))
 
         for astage in fullStageNameList:
-            fullStage = astage.strip()
-            tokenList = astage.split('.')
-            classString = tokenList.pop()
-            classString = classString.strip()
-
-            package = ".".join(tokenList)
-
-            # For example  package -> lsst.pex.harness.App1Stage  classString -> App1Stage
-            AppStage = __import__(package, globals(), locals(), [classString], -1)
-            StageClass = getattr(AppStage, classString)
+            # For example  lsst.pex.harness.App1Stage.App1Stage -> App1Stage
+            StageClass = createStageClass(astage.strip())
             self.stageClassList.append(StageClass)
 
         log.log(self.VERB2, "Imported Stage Classes")
@@ -244,6 +238,12 @@ class Slice(object):
         #   - Read the policy information
         #   - Import failure stage Class and make failure stage instance Object
         #
+        # the system data handed to every stage; each stage adds its own
+        # name and stageId
+        self._sysdata = {"rank": self._rank,
+                         "universeSize": self.universeSize,
+                         "runId": self._runId}
+
         self.failureStageName = None
         self.failParallelName   = None
         if (self.executePolicy.exists('failureStage')):
@@ -257,25 +257,9 @@ class Slice(object):
                 self.failParallelName = "lsst.pex.harness.stage.NoOpParallelProcessing"
                 failStagePolicy = None
 
-            astage = self.failParallelName
-            tokenList = astage.split('.')
-            failClassString = tokenList.pop()
-            failClassString = failClassString.strip()
+            FailStageClass = createStageClass(self.failParallelName.strip())
 
-            package = ".".join(tokenList)
-
-            # For example  package -> lsst.pex.harness.App1Stage  classString -> App1Stage
-            FailAppStage = __import__(package, globals(), locals(), [failClassString], -1)
-            FailStageClass = getattr(FailAppStage, failClassString)
-
-            sysdata = {}
-
-            # sysdata["name"] = self._pipelineName
-            sysdata["name"] = self.failureStageName
-            sysdata["rank"] = self._rank
-            sysdata["stageId"] = -1
-            sysdata["universeSize"] = self.universeSize
-            sysdata["runId"] =  self._runId
+            sysdata = dict(self._sysdata, name=self.failureStageName, stageId=-1)
 
             if (failStagePolicy != None):
                 self.failStageObject = FailStageClass(failStagePolicy, self.log, self.eventBrokerHost, sysdata)
@@ -287,12 +271,15 @@ class Slice(object):
             log.log(self.VERB2, "failParallelName %s " % self.failParallelName)
 
 
-        # Process Event Topics
-        self.eventTopicList = [ ]
-        self.sliceEventTopicList = [ ]
-        for item in fullStageList:
-            self.eventTopicList.append(item.getString("eventTopic"))
-            self.sliceEventTopicList.append(item.getString("eventTopic"))
+        # Process Event Topics: the Pipeline forwards each event to the
+        # Slices on a topic qualified by the pipeline name.  Stages without
+        # an event keep the topic "None".
+        self.eventTopicList = [item.getString("eventTopic")
+                               for item in fullStageList]
+        self.sliceEventTopicList = \
+            [t if t == "None" else "%s_%s" % (t, self._pipelineName)
+             for t in self.eventTopicList]
+        self.hasEventTopicList = [t != "None" for t in self.eventTopicList]
 
         # Check for executionMode of oneloop 
         if (self.executePolicy.exists('executionMode') and (self.executePolicy.getString('executionMode') == "oneloop")):
@@ -307,7 +294,7 @@ class Slice(object):
             self.shareDataList.append(shareDataStage)
 
         log.log(self.VERB3, "Loading in %d trigger topics" % \
-                len(filter(lambda x: x != "None", self.eventTopicList)))
+                sum(1 for t in self.eventTopicList if t != "None"))
         for iStage in xrange(len(self.eventTopicList)):
             item = self.eventTopicList[iStage]
             if self.eventTopicList[iStage] != "None":
@@ -315,15 +302,13 @@ class Slice(object):
             else:
                 log.log(Log.DEBUG, "eventTopic%d: %s" % (iStage+1, item))
 
-        count = 0
-        for item in self.eventTopicList:
-            newitem = "%s_%s" % (item, self._pipelineName)
-            self.sliceEventTopicList[count] = newitem
-            count += 1
-
+        # the event system is only needed once there are topics to receive;
+        # keep it for use on every visit
+        import lsst.ctrl.events as events
         eventsSystem = events.EventSystem.getDefaultEventSystem()
+        self._eventsSystem = eventsSystem
         for topic in self.sliceEventTopicList:
-            if (topic == "None_" + self._pipelineName):
+            if (topic == "None"):
                 pass
             else:
                 eventsSystem.createReceiver(self.eventBrokerHost, topic)
@@ -357,25 +342,15 @@ class Slice(object):
         istageslog = BlockTimingLog(self.log, "initializeStages", self.TRACE)
         istageslog.start()
 
-        for iStage in range(1, self.nStages+1):
-            # Make a Policy object for the Stage Policy file
-            stagePolicy = self.stagePolicyList[iStage-1]
+        for iStage, stagePolicy, StageClass, stageName in \
+                zip(range(1, self.nStages+1), self.stagePolicyList, 
+                    self.stageClassList, self.stageNames):
             # Make an instance of the specifies Application Stage
             # Use a constructor with the Policy as an argument
-            StageClass = self.stageClassList[iStage-1]
-            sysdata = {}
-            # sysdata["name"] = self._pipelineName
-            sysdata["name"] = self.stageNames[iStage-1]
-            sysdata["rank"] = self._rank
-            sysdata["stageId"] = iStage
-            sysdata["universeSize"] = self.universeSize
-            sysdata["runId"] =  self._runId
-            # Here 
-            if (stagePolicy != "None"):
-                stageObject = StageClass(stagePolicy, self.log, self.eventBrokerHost, sysdata)
-                # (self, policy=None, log=None, eventBroker=None, sysdata=None, callSetup=True):
-            else:
-                stageObject = StageClass(None, self.log, self.eventBrokerHost, sysdata)
+            sysdata = dict(self._sysdata, name=stageName, stageId=iStage)
+            # stagePolicy is None for a stage configured without one, which
+            # the Stage constructor accepts
+            stageObject = StageClass(stagePolicy, self.log, self.eventBrokerHost, sysdata)
 
             inputQueue  = self.queueList[iStage-1]
             outputQueue = self.queueList[iStage]
@@ -386,11 +361,29 @@ class Slice(object):
 
         istageslog.done()
 
+    def getEmptyClipboard(self):
+        """
+        Return an empty Clipboard, reusing one released by an earlier visit
+        if one is available
+        """
+        if self._clipPool:
+            return self._clipPool.pop()
+        return Clipboard()
+
+    def releaseClipboard(self, clipboard):
+        """
+        Empty a Clipboard that is no longer needed and keep it for reuse
+        by getEmptyClipboard()
+        """
+        clipboard.close()
+        if len(self._clipPool) < clipPoolSize:
+            self._clipPool.append(clipboard)
+
     def startInitQueue(self):
         """
         Place an empty Clipboard in the first Queue
         """
-        clipboard = Clipboard()
+        clipboard = self.getEmptyClipboard()
         queue1 = self.queueList[0]
         queue1.addDataset(clipboard)
 
@@ -398,7 +391,7 @@ class Slice(object):
         """
         Place an empty Clipboard in the output queue for designated stage
         """
-        clipboard = Clipboard()
+        clipboard = self.getEmptyClipboard()
         queue2 = self.queueList[iStage]
         queue2.addDataset(clipboard)
 
@@ -426,9 +419,27 @@ class Slice(object):
 
         self.threadBarrier()
 
+        # The stages are fixed by now; gather what each iteration of the
+        # stage loop needs, including the fixed per-stage messages, and bind
+        # the per-stage calls to locals so that the loop does not redo the
+        # lookups and formatting on every visit.
+        stages = []
+        for iStage, stageObject, stageName, hasEventTopic in \
+                zip(range(1, self.nStages+1), self.stageList,
+                    self.stageNames, self.hasEventTopicList):
+            stages.append((iStage, stageObject, stageName, hasEventTopic,
+                           stageName + " loop",
+                           "Begin stage loop iteration iStage %d " % iStage,
+                           "End stage loop iteration iStage %d " % iStage))
+        threadBarrier = self.threadBarrier
+        handleEvents = self.handleEvents
+        tryProcess = self.tryProcess
+
         visitcount = 0
         while True:
-            self.log.log(Log.INFO, "visitcount %d %s " %  (visitcount, datetime.datetime.now()))
+            # only build the message (and read the clock) if it will be sent
+            if self.log.sends(Log.INFO):
+                self.log.log(Log.INFO, "visitcount %d %s " %  (visitcount, datetime.datetime.now()))
 
             if ((self.executionMode == 1) and (visitcount == 1)):
                 LogRec(looplog, Log.INFO)  << "terminating Slice Stage Loop "
@@ -440,46 +451,68 @@ class Slice(object):
 
             stagelog.setPreamblePropertyInt("LOOPNUM", visitcount)
             # stagelog.setPreamblePropertyInt("stagename", visitcount)
-            timesVisitStart = os.times()
 
-            # looplog.setPreamblePropertyFloat("usertime", timesVisitStart[0])
-            # looplog.setPreamblePropertyFloat("systemtime", timesVisitStart[1])
-            looplog.setPreamblePropertyDouble("usertime", timesVisitStart[0])
-            looplog.setPreamblePropertyDouble("systemtime", timesVisitStart[1])
+            # the process times only show up in the visit's timing records
+            # and its INFO summary, so only read them if one will be sent
+            timeVisit = looplog.sends(max(Log.INFO, self.TRACE))
+            if timeVisit:
+                timesVisitStart = os.times()
+
+                # looplog.setPreamblePropertyFloat("usertime", timesVisitStart[0])
+                # looplog.setPreamblePropertyFloat("systemtime", timesVisitStart[1])
+                looplog.setPreamblePropertyDouble("usertime", timesVisitStart[0])
+                looplog.setPreamblePropertyDouble("systemtime", timesVisitStart[1])
             looplog.start()
 
             self.startInitQueue()    # place an empty clipboard in the first Queue
 
             self.errorFlagged = 0
-            for iStage in range(1, self.nStages+1):
+            for iStage, stageObject, stageName, hasEventTopic, \
+                    blockName, beginMsg, endMsg in stages:
                 stagelog.setPreamblePropertyInt("STAGEID", iStage)
-                stagelog.setPreamblePropertyString("stagename", self.stageNames[iStage-1])
-                stagelog.start(self.stageNames[iStage-1] + " loop")
-                stagelog.log(Log.INFO, "Begin stage loop iteration iStage %d " % iStage)
+                stagelog.setPreamblePropertyString("stagename", stageName)
+                stagelog.start(blockName)
+                stagelog.log(Log.INFO, beginMsg)
 
-                stageObject = self.stageList[iStage-1]
-                self.handleEvents(iStage, stagelog)
+                if hasEventTopic:
+                    handleEvents(iStage, stagelog)
 
-                # synchronize before preprocess
-                self.threadBarrier()
+                    # stopped while waiting for the event
+                    if self._shutdown:
+                        stagelog.done()
+                        break
 
                 # synchronize after preprocess, before process
-                self.threadBarrier()
+                threadBarrier()
 
-                self.tryProcess(iStage, stageObject, stagelog)
+                # the Pipeline released this barrier to stop the Slices
+                if self._shutdown:
+                    stagelog.done()
+                    break
 
-                # synchronize after process, before postprocess
-                self.threadBarrier()
+                tryProcess(iStage, stageObject, stagelog)
 
-                # synchronize after postprocess
-                self.threadBarrier()
+                # synchronize after process, before postprocess
+                threadBarrier()
 
-                stagelog.log(self.TRACE, "End stage loop iteration iStage %d " % iStage)
-                stagelog.log(Log.INFO, "End stage loop iteration : ErrorCheck \
-                   iStage %d stageName %s errorFlagged_%d " % (iStage, self.stageNames[iStage-1], self.errorFlagged) )
+                stagelog.log(self.TRACE, endMsg)
+                if stagelog.sends(Log.INFO):
+                    stagelog.log(Log.INFO, "End stage loop iteration : ErrorCheck \
+                       iStage %d stageName %s errorFlagged_%d " % (iStage, stageName, self.errorFlagged) )
 
                 stagelog.done()
 
+                # a stage found the end of the data; stop now that this
+                # stage is in step with the Pipeline, which will see the
+                # request through isShutdownRequested() and stop as well
+                if self._shutdown:
+                    break
+
+            if self._shutdown:
+                looplog.log(Log.INFO, "terminating Slice Stage Loop: shutdown requested")
+                looplog.done()
+                break
+
             looplog.log(self.VERB2, "Completed Stage Loop")
 
             # If no error/exception was flagged, then clear the final Clipboard in the final Queue
@@ -488,35 +521,28 @@ class Slice(object):
                             "Retrieving final Clipboard for deletion")
                 finalQueue = self.queueList[self.nStages]
                 finalClipboard = finalQueue.getNextDataset()
-                finalClipboard.close()
+                self.releaseClipboard(finalClipboard)
                 del finalClipboard
                 looplog.log(Log.DEBUG, "Deleted final Clipboard")
             else:
                 looplog.log(self.VERB3, "Error flagged on this visit")
 
-            timesVisitDone = os.times()
-            utime = timesVisitDone[0] - timesVisitStart[0]
-            stime = timesVisitDone[1] - timesVisitStart[1]
-            wtime = timesVisitDone[4] - timesVisitStart[4]
-            totalTime = utime + stime
-            looplog.log(Log.INFO, "visittimes : utime %.4f stime %.4f  total %.4f wtime %.4f" % (utime, stime, totalTime, wtime) )
-
-            # looplog.setPreamblePropertyFloat("usertime", timesVisitDone[0])
-            # looplog.setPreamblePropertyFloat("systemtime", timesVisitDone[1])
-            looplog.setPreamblePropertyDouble("usertime", timesVisitDone[0])
-            looplog.setPreamblePropertyDouble("systemtime", timesVisitDone[1])
+            if timeVisit:
+                timesVisitDone = os.times()
+                utime = timesVisitDone[0] - timesVisitStart[0]
+                stime = timesVisitDone[1] - timesVisitStart[1]
+                wtime = timesVisitDone[4] - timesVisitStart[4]
+                totalTime = utime + stime
+                if looplog.sends(Log.INFO):
+                    looplog.log(Log.INFO, "visittimes : utime %.4f stime %.4f  total %.4f wtime %.4f" % (utime, stime, totalTime, wtime) )
+
+                # looplog.setPreamblePropertyFloat("usertime", timesVisitDone[0])
+                # looplog.setPreamblePropertyFloat("systemtime", timesVisitDone[1])
+                looplog.setPreamblePropertyDouble("usertime", timesVisitDone[0])
+                looplog.setPreamblePropertyDouble("systemtime", timesVisitDone[1])
             looplog.done()
 
-            try:
-                memmsg = "mem:"
-                with open("/proc/%d/status" % os.getpid(), "r") as f:
-                    for l in f:
-                        m = re.match(r'Vm(Size|RSS|Peak|HWM):\s+(\d+ \wB)', l)
-                        if m:
-                            memmsg += " %s=%s" % m.groups()
-                looplog.log(Log.INFO, memmsg)
-            except:
-                pass
+            self.logMemUsage(looplog, visitcount)
 
             # LogRec(looplog, Log.INFO) << Prop("usertime", utime) \
             #                            << Prop("systemtime", stime) \
@@ -524,46 +550,104 @@ class Slice(object):
 
         startStagesLoopLog.done()
 
+    def logMemUsage(self, log, visitcount):
+        """
+        Log the memory use of this process.  The current and resident sizes
+        are read from the one-line /proc/<pid>/statm each visit; the peak
+        values require a scan of /proc/<pid>/status and so are added only
+        every memPeakInterval visits (starting with the first).  Nothing is
+        read if the log will not send the INFO message.
+        """
+        if not log.sends(Log.INFO):
+            return
+
+        try:
+            with open("/proc/%d/statm" % os.getpid(), "r") as f:
+                pages = f.readline().split()
+            memmsg = "mem: Size=%d kB RSS=%d kB" % \
+                     (int(pages[0]) * pageKB, int(pages[1]) * pageKB)
+
+            if visitcount % memPeakInterval == 1:
+                with open("/proc/%d/status" % os.getpid(), "r") as f:
+                    for l in f:
+                        m = vmpeakline.match(l)
+                        if m:
+                            memmsg += " %s=%s" % m.groups()
+
+            log.log(Log.INFO, memmsg)
+        except:
+            pass
+
     def threadBarrier(self):
         """
         Create an approximate barrier where all Slices intercommunicate with the Pipeline 
         """
 
-        log = Log(self.log, "threadBarrier")
+        log = self._barrierLog
+        debug = log.sends(Log.DEBUG)
 
-        entryTime = time.time()
-        log.log(Log.DEBUG, "Slice %d waiting for signal from Pipeline %f" % (self._rank, entryTime))
+        if debug:
+            entryTime = time.time()
+            log.log(Log.DEBUG, "Slice %d waiting for signal from Pipeline %f" % (self._rank, entryTime))
 
         self.loopEventA.wait()
 
-        signalTime1 = time.time()
-        log.log(Log.DEBUG, "Slice %d done waiting; signaling back %f" % (self._rank, signalTime1))
+        if debug:
+            signalTime1 = time.time()
+            log.log(Log.DEBUG, "Slice %d done waiting; signaling back %f" % (self._rank, signalTime1))
 
         if(self.loopEventA.isSet()):
             self.loopEventA.clear()
 
         self.loopEventB.set()
 
-        signalTime2 = time.time()
-        log.log(Log.DEBUG, "Slice %d sent signal back. Exit threadBarrier  %f" % (self._rank, signalTime2))
+        if debug:
+            signalTime2 = time.time()
+            log.log(Log.DEBUG, "Slice %d sent signal back. Exit threadBarrier  %f" % (self._rank, signalTime2))
+
+    def isShutdownRequested(self):
+        """
+        Return True if this Slice is leaving its stage loop, either because
+        one of its stages found no more datasets or because it was stopped
+        """
+        return self._shutdown
+
+    def stop(self):
+        """
+        Tell the Slice to leave its stage loop at its next synchronization
+        point, and let a Slice that has already left it finish its shutdown
+        """
+        self._shutdown = True
+        self._stopEvent.set()
 
     def shutdown(self): 
         """
-        Shutdown the Slice execution
+        Shutdown the Slice execution.  If a stage asked for the shutdown
+        and this Slice runs in step with a Pipeline, wait for the Pipeline
+        to stop the Slices (see Pipeline.shutdown()) so that this Slice's
+        thread can simply finish; only if that does not happen within
+        shutdownTimeout seconds is the process ended.  A Slice run on its
+        own (without loop events) has nothing to wait for.
         """
         shutlog = Log(self.log, "shutdown", Log.INFO);
         pid = os.getpid()
         shutlog.log(Log.INFO, "Shutting down Slice:  pid " + str(pid))
-        os.kill(pid, signal.SIGKILL) 
 
-    def tryProcess(self, iStage, stage, stagelog):
+        if self._shutdown and self.loopEventA is not None and \
+                not self._stopEvent.wait(shutdownTimeout):
+            shutlog.log(Log.WARN,
+                        "Pipeline did not stop the Slices; exiting process")
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(1)
+
+    def tryProcess(self, iStage, stageObject, stagelog):
         """
         Executes the try/except construct for Stage process() call 
         """
         # Important try - except construct around stage process() 
         proclog = stagelog.timeBlock("tryProcess", self.TRACE-2);
 
-        stageObject = self.stageList[iStage-1]
         proclog.log(self.VERB3, "Getting process signal from Pipeline")
 
         # Important try - except construct around stage process() 
@@ -580,7 +664,7 @@ class Slice(object):
 
                 if clipboard.has_key("noMoreDatasets"): 
                     proclog.log(Log.INFO, "Ready_For_Shutdown")
-                    self.shutdown();
+                    self._shutdown = True
 
                 processlog.done()
             else:
@@ -588,8 +672,9 @@ class Slice(object):
                 self.transferClipboard(iStage)
   
         except:
+            excType, excValue, excTraceback = sys.exc_info()
             trace = "".join(traceback.format_exception(
-                sys.exc_info()[0], sys.exc_info()[1], sys.exc_info()[2]))
+                excType, excValue, excTraceback))
             proclog.log(Log.FATAL, trace)
 
             # Flag that an exception occurred to guide the framework to skip processing
@@ -599,20 +684,19 @@ class Slice(object):
             if(self.failureStageName != None):
                 if(self.failParallelName != "lsst.pex.harness.stage.NoOpParallelProcessing"):
 
-                    LogRec(proclog, self.VERB2) << "failureStageName exists "    \
-                                           << self.failureStageName     \
-                                           << "and failParallelName exists "    \
-                                           << self.failParallelName     \
-                                           << LogRec.endr;
+                    if proclog.sends(self.VERB2):
+                        proclog.log(self.VERB2,
+                            "failureStageName exists %s and failParallelName exists %s" %
+                            (self.failureStageName, self.failParallelName))
 
                     inputQueue  = self.queueList[iStage-1]
                     outputQueue = self.queueList[iStage]
 
                     clipboard = inputQueue.element()
-                    clipboard.put("failedInStage",  stage.getName())
+                    clipboard.put("failedInStage",  stageObject.getName())
                     clipboard.put("failedInStageN", iStage)
-                    clipboard.put("failureType", str(sys.exc_info()[0]))
-                    clipboard.put("failureMessage", str(sys.exc_info()[1]))
+                    clipboard.put("failureType", str(excType))
+                    clipboard.put("failureMessage", str(excValue))
                     clipboard.put("failureTraceback", trace)
 
                     self.failStageObject.initialize(outputQueue, inputQueue)
@@ -621,7 +705,7 @@ class Slice(object):
 
                     proclog.log(self.TRACE, "Popping off failure stage Clipboard")
                     clipboard = outputQueue.getNextDataset()
-                    clipboard.close()
+                    self.releaseClipboard(clipboard)
                     del clipboard
                     proclog.log(self.TRACE, "Erasing and deleting failure stage Clipboard")
 
@@ -638,40 +722,45 @@ class Slice(object):
         Handles Events: transmit or receive events as specified by Policy
         """
         log = stagelog.timeBlock("handleEvents", self.TRACE-2)
-        eventsSystem = events.EventSystem.getDefaultEventSystem()
+        eventsSystem = self._eventsSystem
 
         thisTopic = self.eventTopicList[iStage-1]
 
         if (thisTopic != "None"):
-            log.log(self.VERB3, "Processing topic: " + thisTopic)
+            if log.sends(self.VERB3):
+                log.log(self.VERB3, "Processing topic: " + thisTopic)
             sliceTopic = self.sliceEventTopicList[iStage-1]
 
             waitlog = log.timeBlock("eventwait " + sliceTopic, self.TRACE,
                                     "wait for event...")
 
             # Receive the event from the Pipeline 
-            # Call with a timeout , followed by a call to time sleep to free the GIL 
-            # periodically
+            # Call with a timeout; between timed-out calls, a zero-length
+            # sleep frees the GIL for the other threads without delaying
+            # the pick-up of an event that arrives in the meantime.
 
-            sleepTimeout = 0.1
             transTimeout = 900
 
             inputParamPropertySetPtr = eventsSystem.receive(sliceTopic, transTimeout)
             while(inputParamPropertySetPtr == None):
-                time.sleep(sleepTimeout)
+                # the Pipeline stopped the Slices and will send no more events
+                if self._shutdown:
+                    waitlog.done()
+                    log.done()
+                    return
+                time.sleep(0)
                 inputParamPropertySetPtr = eventsSystem.receive(sliceTopic, transTimeout)
-     
+
 
             waitlog.done()
-            LogRec(log, self.TRACE) << "received event; contents: "        \
-                                << inputParamPropertySetPtr \
-                                << LogRec.endr
+            if log.sends(self.TRACE):
+                LogRec(log, self.TRACE) << "received event; contents: "        \
+                                    << inputParamPropertySetPtr \
+                                    << LogRec.endr
 
 
             self.populateClipboard(inputParamPropertySetPtr, iStage, thisTopic)
             log.log(self.VERB3, 'Received event; added payload to clipboard')
-        else:
-            log.log(Log.DEBUG, 'No event to handle')
 
         log.done()
 
@@ -679,7 +768,7 @@ class Slice(object):
         """
         Place the event payload onto the Clipboard
         """
-        log = Log(self.log, "populateClipboard");
+        log = self._populateLog
         log.log(Log.DEBUG,'Python Pipeline populateClipboard');
 
         queue = self.queueList[iStage-1]
@@ -762,4 +851,18 @@ class Slice(object):
 
 trailingpolicy = re.compile(r'_*(policy|dict)$', re.IGNORECASE)
 
+# the lines of /proc/<pid>/status reporting peak memory use
+vmpeakline = re.compile(r'Vm(Peak|HWM):\s+(\d+ \wB)')
+
+# the number of visits between reports of peak memory use
+memPeakInterval = 100
+
+# the size in kB of the memory pages counted in /proc/<pid>/statm
+pageKB = os.sysconf("SC_PAGE_SIZE") >> 10
+
+# the most empty Clipboards kept for reuse on later visits
+clipPoolSize = 4
 
+# the seconds a Slice whose stage asked for a shutdown waits for the
+# Pipeline to stop it before ending the process
+shutdownTimeout = 60.0
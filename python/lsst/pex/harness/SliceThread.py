@@ -50,6 +50,9 @@ class SliceThread(threading.Thread):
     def stop (self):
         self.pySlice.stop()
 
+    def isShutdownRequested (self):
+        return self.pySlice.isShutdownRequested()
+
     def exit (self):
         # thread.exit()
         print "RAISE SYSTEM EXIT" 
@@ -0,0 +1,62 @@
+#! /usr/bin/env python
+
+# 
+# LSST Data Management System
+# Copyright 2008, 2009, 2010 LSST Corporation.
+# 
+# This product includes software developed by the
+# LSST Project (http://www.lsst.org/).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the LSST License Statement and 
+# the GNU General Public License along with this program.  If not, 
+# see <http://www.lsstcorp.org/LegalNotices/>.
+#
+
+"""
+TriggerClient publishes trigger events to an event broker on behalf of
+scripts that drive a pipeline.  A transmitter (and thus a broker
+connection) is opened for a topic the first time an event is published to
+it and is reused for every later event on that topic.
+"""
+
+import lsst.ctrl.events as events
+
+class TriggerClient(object):
+    '''Publish events to the broker, reusing one transmitter per topic'''
+
+    #------------------------------------------------------------------------
+    def __init__(self, broker):
+        """
+        Initialize the client for the given event broker host
+        """
+        self._broker = broker
+        self._transmitters = {}
+
+    #------------------------------------------------------------------------
+    def publish(self, topic, propertySet):
+        """
+        Publish the given PropertySet as an event on the named topic
+        """
+        transmitter = self._transmitters.get(topic)
+        if transmitter is None:
+            transmitter = events.EventTransmitter(self._broker, topic)
+            self._transmitters[topic] = transmitter
+        transmitter.publish(propertySet)
+
+    #------------------------------------------------------------------------
+    def close(self):
+        """
+        Drop this client's references to its transmitters.  Their broker
+        connections are closed once the transmitters are garbage-collected.
+        """
+        self._transmitters.clear()
@@ -75,7 +75,7 @@ class Dataset(object):
             return False
         if other.type != self.type:
             return False
-        if len(filter(lambda d: d.ids is None, [self, other])) == 1:
+        if (self.ids is None) != (other.ids is None):
             return False
         
         keys = other.ids.keys()
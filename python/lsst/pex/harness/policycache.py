@@ -0,0 +1,85 @@
+#! /usr/bin/env python
+
+# 
+# LSST Data Management System
+# Copyright 2008, 2009, 2010 LSST Corporation.
+# 
+# This product includes software developed by the
+# LSST Project (http://www.lsst.org/).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the LSST License Statement and 
+# the GNU General Public License along with this program.  If not, 
+# see <http://www.lsstcorp.org/LegalNotices/>.
+#
+
+"""
+a cache of parsed policy files.
+
+Many stage instances (one per Slice) and many Slices within one process
+read the same policy files.  createPolicy() here parses a given file only
+once for as long as the file is unchanged on disk and hands out copies of
+the result.
+"""
+from __future__ import with_statement
+
+import os, threading
+
+from lsst.pex.policy import Policy
+
+_cache = {}
+_cacheLock = threading.Lock()
+
+def createPolicy(policyFile, repository=None, loadFiles=False):
+    """
+    return a Policy read from the given file, as with Policy.createPolicy();
+    however, if the same file (unchanged since it was last read) has been
+    loaded before with the same repository, the earlier parse will be 
+    reused.  The caller always gets its own (deep) copy and so may freely 
+    update it (e.g. via mergeDefaults()).
+    @param policyFile   the policy file to read, given either as a path or
+                          as a PolicyFile (e.g. a DefaultPolicyFile) instance
+    @param repository   the directory to look for included policy files in.
+                          If None, it is not passed on to createPolicy().
+    @param loadFiles    if True, call loadPolicyFiles() on the policy before
+                          caching it so that included policy files are 
+                          also read just once.  Note that only the named 
+                          file (and not the included ones) is checked for
+                          changes.
+    """
+    if isinstance(policyFile, basestring):
+        path = policyFile
+    else:
+        path = policyFile.getPath()
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    key = (path, st.st_mtime, st.st_size, repository, loadFiles)
+
+    with _cacheLock:
+        pol = _cache.get(key)
+        if pol is None:
+            if repository is None:
+                pol = Policy.createPolicy(policyFile)
+            else:
+                pol = Policy.createPolicy(policyFile, repository)
+            if loadFiles:
+                pol.loadPolicyFiles()
+            _cache[key] = pol
+
+    return Policy(pol, True)
+
+def clearCache():
+    """
+    forget all previously parsed policy files
+    """
+    with _cacheLock:
+        _cache.clear()
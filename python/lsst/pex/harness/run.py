@@ -154,7 +154,7 @@ def launchPipeline(policyFile, runid, workerid=None, name=None, verbosity=None,
 
     clineOptions += " -g %s" % logdir
 
-    cmd = "runPipelin.sh.py %s %s %s" % \
+    cmd = "runPipeline.py %s %s %s" % \
           (clineOptions, policyFile, runid)
 
     logger.log(Log.INFO, "CMD to execute:") 
@@ -555,11 +555,24 @@ class Stage(object):
 
         return cls(self.stagePolicy, log, self.eventBroker, sysdata)
 
-def _createClass(name):
-    (modn, cln) = name.rsplit('.', 1)
-    mod = __import__(modn, globals(), locals(), [cln], -1)
-    stageClass = getattr(mod, cln)
+# stage classes already resolved by createStageClass(), keyed by full name
+_stageClasses = {}
+
+def createStageClass(name):
+    """
+    return the class with the given fully-qualified name (e.g.
+    "lsst.pex.harness.stage.NoOpParallelProcessing"), importing its module
+    the first time the name is asked for.
+    """
+    stageClass = _stageClasses.get(name)
+    if stageClass is None:
+        (modn, cln) = name.rsplit('.', 1)
+        mod = __import__(modn, globals(), locals(), [cln], -1)
+        stageClass = getattr(mod, cln)
+        _stageClasses[name] = stageClass
     return stageClass
+
+_createClass = createStageClass
     
 def makeStageFromPolicy(stageDefPolicy, log=None, eventBroker=None,
                         sysdata=None):
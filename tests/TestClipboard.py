@@ -51,3 +51,26 @@ except Exception, e:
     # print "Exception " + "args[0] = " + e.args[0] 
     # print "Message is = " + str(e)  
 
+# A closed Clipboard has no keys and no shared keys
+clip.put("sharedItem", event, True)
+assert "sharedItem" in clip.getSharedKeys()
+clip.close()
+assert clip.getKeys() == []
+assert clip.getSharedKeys() == []
+assert not clip.isShared
+
+# A Clipboard a Slice recycles starts out empty
+from lsst.pex.harness.Slice import Slice
+
+slice = Slice()
+clip = slice.getEmptyClipboard()
+clip.put("tcsEvent", event, True)
+slice.releaseClipboard(clip)
+
+reused = slice.getEmptyClipboard()
+assert reused is clip
+assert reused.getKeys() == []
+assert reused.getSharedKeys() == []
+assert not reused.isShared
+assert reused.get("tcsEvent") is None
+
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+# 
+# LSST Data Management System
+# Copyright 2008, 2009, 2010 LSST Corporation.
+# 
+# This product includes software developed by the
+# LSST Project (http://www.lsst.org/).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the LSST License Statement and 
+# the GNU General Public License along with this program.  If not, 
+# see <http://www.lsstcorp.org/LegalNotices/>.
+#
+
+
+"""
+Tests of the Directories class
+"""
+from __future__ import with_statement
+
+import pdb                              # we may want to say pdb.set_trace()
+import os
+import sys
+import unittest
+
+from lsst.pex.harness.Directories import Directories, standardDirs
+from lsst.pex.policy import Policy
+
+class DirectoriesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = Policy()
+        self.policy.set("defaultRoot", "/tmp/harness")
+        self.policy.set("runDirPattern", "%(shortname)s/%(runid)s")
+        self.policy.set("work", "work")
+        self.policy.set("input", "/data/input")
+        self.policy.set("update", "update")
+    def tearDown(self):
+        pass
+
+    def testDefaultRootDir(self):
+        dirs = Directories(self.policy, "pipe", "rid")
+        self.assertEquals(dirs.getDefaultRootDir(), "/tmp/harness")
+
+        self.policy.set("defaultRoot", ".")
+        dirs = Directories(self.policy, "pipe", "rid")
+        self.assertEquals(dirs.getDefaultRootDir(), os.getcwd())
+
+        self.policy.set("defaultRoot", "harness")
+        dirs = Directories(self.policy, "pipe", "rid")
+        self.assertEquals(dirs.getDefaultRootDir(),
+                          os.path.join(os.getcwd(), "harness"))
+
+    def testDefaultRunDir(self):
+        dirs = Directories(self.policy, "pipe", "rid")
+        self.assertEquals(dirs.getDefaultRunDir(), "/tmp/harness/pipe/rid")
+
+        # an absolute pattern is still relative to the default root
+        self.policy.set("runDirPattern", "/%(runid)s")
+        dirs = Directories(self.policy, "pipe", "rid")
+        self.assertEquals(dirs.getDefaultRunDir(), "/tmp/harness/rid")
+
+        self.policy.set("runDirPattern", "//%(shortname)s")
+        dirs = Directories(self.policy, "pipe", "rid")
+        self.assertEquals(dirs.getDefaultRunDir(), "/tmp/harness/pipe")
+
+    def testNamedDirectory(self):
+        dirs = Directories(self.policy, "pipe", "rid")
+        self.assertEquals(dirs.getNamedDirectory("work"),
+                          "/tmp/harness/pipe/rid/work")
+        self.assertEquals(dirs.getNamedDirectory("input"), "/data/input")
+        self.assertEquals(dirs.getNamedDirectory("update"),
+                          "/tmp/harness/pipe/rid/update")
+
+        # names missing from the policy fall back to the update directory
+        self.assertEquals(dirs.getNamedDirectory("output"),
+                          "/tmp/harness/pipe/rid/update")
+        self.assertEquals(dirs.getNamedDirectory("goob"),
+                          "/tmp/harness/pipe/rid/update")
+
+    def testMemoized(self):
+        dirs = Directories(self.policy, "pipe", "rid")
+        root = dirs.getDefaultRootDir()
+        runDir = dirs.getDefaultRunDir()
+        work = dirs.getNamedDirectory("work")
+        output = dirs.getNamedDirectory("output")
+
+        # later changes to the policy do not affect resolved directories
+        self.policy.set("defaultRoot", "/tmp/other")
+        self.policy.set("runDirPattern", "%(runid)s")
+        self.policy.set("work", "/tmp/work")
+        self.policy.set("update", "/tmp/update")
+        self.assertEquals(dirs.getDefaultRootDir(), root)
+        self.assertEquals(dirs.getDefaultRunDir(), runDir)
+        self.assertEquals(dirs.getNamedDirectory("work"), work)
+        self.assertEquals(dirs.getNamedDirectory("output"), output)
+        self.assertEquals(dirs.getNamedDirectory("update"), output)
+
+        # ...but a new instance sees them
+        dirs = Directories(self.policy, "pipe", "rid")
+        self.assertEquals(dirs.getDefaultRunDir(), "/tmp/other/rid")
+        self.assertEquals(dirs.getNamedDirectory("work"), "/tmp/work")
+        self.assertEquals(dirs.getNamedDirectory("output"), "/tmp/update")
+
+    def testGetDirs(self):
+        dirs = Directories(self.policy, "pipe", "rid")
+        ps = dirs.getDirs()
+        for name in standardDirs:
+            self.assert_(ps.exists(name))
+            self.assertEquals(ps.getString(name),
+                              dirs.getNamedDirectory(name))
+        self.assertEquals(ps.getString("scratch"),
+                          "/tmp/harness/pipe/rid/update")
+
+
+__all__ = "DirectoriesTestCase".split()
+
+if __name__ == "__main__":
+    unittest.main()
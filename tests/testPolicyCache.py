@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+# 
+# LSST Data Management System
+# Copyright 2008, 2009, 2010 LSST Corporation.
+# 
+# This product includes software developed by the
+# LSST Project (http://www.lsst.org/).
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# 
+# You should have received a copy of the LSST License Statement and 
+# the GNU General Public License along with this program.  If not, 
+# see <http://www.lsstcorp.org/LegalNotices/>.
+#
+
+
+"""
+Tests of the policycache module
+"""
+from __future__ import with_statement
+
+import pdb                              # we may want to say pdb.set_trace()
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import lsst.pex.harness.policycache as policycache
+from lsst.pex.policy import Policy
+
+class PolicyCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        policycache.clearCache()
+        self.tmpdir = tempfile.mkdtemp()
+        self.policyFile = os.path.join(self.tmpdir, "cache.paf")
+        self.writePolicy('name: "first"\n')
+    def tearDown(self):
+        policycache.clearCache()
+        shutil.rmtree(self.tmpdir)
+
+    def writePolicy(self, contents, mtime=None):
+        with open(self.policyFile, "w") as f:
+            f.write(contents)
+        if mtime is not None:
+            os.utime(self.policyFile, (mtime, mtime))
+
+    def testCopies(self):
+        pol = policycache.createPolicy(self.policyFile)
+        self.assertEquals(pol.getString("name"), "first")
+        self.assertEquals(len(policycache._cache), 1)
+
+        # updating one copy leaves the cached policy untouched
+        pol.set("name", "changed")
+        pol.set("extra", 3)
+        pol2 = policycache.createPolicy(self.policyFile)
+        self.assertEquals(len(policycache._cache), 1)
+        self.assertEquals(pol2.getString("name"), "first")
+        self.assert_(not pol2.exists("extra"))
+        self.assertEquals(pol.getString("name"), "changed")
+
+    def testReparse(self):
+        pol = policycache.createPolicy(self.policyFile)
+        mtime = os.stat(self.policyFile).st_mtime
+
+        # a change in size alone forces a re-parse
+        self.writePolicy('name: "second"\n', mtime)
+        pol = policycache.createPolicy(self.policyFile)
+        self.assertEquals(pol.getString("name"), "second")
+
+        # so does a change in modification time alone
+        self.writePolicy('name: "latest"\n', mtime + 10)
+        pol = policycache.createPolicy(self.policyFile)
+        self.assertEquals(pol.getString("name"), "latest")
+
+    def testKey(self):
+        policycache.createPolicy(self.policyFile)
+        self.assertEquals(len(policycache._cache), 1)
+
+        pol = policycache.createPolicy(self.policyFile, self.tmpdir)
+        self.assertEquals(len(policycache._cache), 2)
+        self.assertEquals(pol.getString("name"), "first")
+
+        pol = policycache.createPolicy(self.policyFile, loadFiles=True)
+        self.assertEquals(len(policycache._cache), 3)
+        self.assertEquals(pol.getString("name"), "first")
+
+        # the same arguments reuse an entry
+        policycache.createPolicy(self.policyFile, self.tmpdir)
+        policycache.createPolicy(self.policyFile, loadFiles=True)
+        self.assertEquals(len(policycache._cache), 3)
+
+    def testClearCache(self):
+        policycache.createPolicy(self.policyFile)
+        self.assertEquals(len(policycache._cache), 1)
+        policycache.clearCache()
+        self.assertEquals(len(policycache._cache), 0)
+
+        pol = policycache.createPolicy(self.policyFile)
+        self.assertEquals(len(policycache._cache), 1)
+        self.assertEquals(pol.getString("name"), "first")
+
+
+__all__ = "PolicyCacheTestCase".split()
+
+if __name__ == "__main__":
+    unittest.main()